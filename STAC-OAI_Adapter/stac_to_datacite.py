@@ -1,20 +1,28 @@
 #python stac_to_datacite.py https://api.eneslab.pilot.eosc-beyond.eu/collections/CMIP_S3  
+import argparse
 import logging
+import math
 import os
 import sys
 import re
 import json
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from logging_config import setup_logging
 from utils.stac_api import StacApiUtils
 from utils.datacite_utils import DataciteExportXML
+from utils.work_queue import WorkQueue, default_worker_id
+from utils.oai_validation import SCHEMA_DIR, missing_schemas
 
 
 
 EXPORT_JSON_DIR = "./exports"
 EXPORT_XML_DIR = os.path.join(os.path.expanduser("~"), "Downloads", "oai_aire_records")
 MAX_WORKERS = 8
+PARTITION_SIZE = 5000
+LEASE_SECONDS = 600
+WORKER_POLL_SECONDS = 5
 
 
 def safe_year(date_str):
@@ -26,6 +34,11 @@ def safe_year(date_str):
         return None
 
 
+def parse_utc(date_str):
+    dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
 def safe_filename(value: str, max_len=150) -> str:
     value = value.strip()
     value = re.sub(r'[<>:"/\\|?*]', '_', value)
@@ -216,12 +229,51 @@ def fetch_items(api, collection):
     return collection, items
 
 
-def main():
-    if len(sys.argv) < 2:
-        logger.error("Usage: python stac_to_datacite.py <STAC URL>")
+def export_item_records(collection_id, items, base_url, validator=None):
+    item_dc = [stac_item_to_datacite(i, base_url) for i in items]
+    if item_dc:
+        export_json(item_dc, "items", collection_id, is_item=True)
+        DataciteExportXML.export_oai_aire(item_dc, EXPORT_XML_DIR, validator=validator)
+
+
+def export_collection_record(collection, items, base_url, validator=None):
+    col_dc = stac_collection_to_datacite(collection, base_url, items)
+    export_json([col_dc], "collections")
+    DataciteExportXML.export_oai_aire([col_dc], EXPORT_XML_DIR, validator=validator)
+
+
+def create_validator(enabled):
+    if not enabled:
+        return None
+    missing = missing_schemas()
+    if missing:
+        logger.error(
+            f"OAI-AIRE schemas not found in {SCHEMA_DIR}: {', '.join(missing)} "
+            f"(see schemas/README.md)"
+        )
+        sys.exit(1)
+    try:
+        from lxml import etree
+        from utils.oai_validation import OaiAireValidator
+    except ImportError as e:
+        logger.error(f"OAI-AIRE validation unavailable: {e}")
+        sys.exit(1)
+    try:
+        return OaiAireValidator()
+    except (OSError, etree.XMLSyntaxError, etree.XMLSchemaParseError) as e:
+        logger.error(f"OAI-AIRE validation unavailable: {e}")
         sys.exit(1)
 
-    input_url = sys.argv[1]
+
+def finish_validation(validator, report_path):
+    if not validator:
+        return
+    report = validator.close()
+    validator.write_report(report, report_path)
+    logger.info(f"OAI-AIRE validation: {report['invalid_count']}/{report['total']} invalid records, report written to {report_path}")
+
+
+def resolve_collections(input_url):
     logger.info(f"Fetching: {input_url}")
 
     api = StacApiUtils(input_url)
@@ -248,6 +300,149 @@ def main():
                 logger.info(f"Collection {collection_id} not found")
                 sys.exit(1)
 
+    return api, collections
+
+
+def partition_collection(api, collection, partition_size):
+    count = api.count_items(collection["id"])
+    interval = (((collection.get("extent") or {}).get("temporal") or {}).get("interval") or [[None, None]])[0]
+    start, end = (interval + [None, None])[:2]
+
+    if not count or count <= partition_size or not start or not end:
+        return [None]
+
+    start, end = parse_utc(start), parse_utc(end)
+    parts = math.ceil(count / partition_size)
+    step = (end - start) / parts
+    if step <= timedelta(microseconds=1):
+        return [None]
+
+    # consecutive partitions start 1 µs after the previous one ends, so that the closed
+    # STAC intervals do not overlap; the outer partitions are open-ended to catch items
+    # outside the declared temporal extent
+    fmt = lambda d: d.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    cuts = [start + step * i for i in range(1, parts)]
+    starts = [".."] + [fmt(c + timedelta(microseconds=1)) for c in cuts]
+    ends = [fmt(c) for c in cuts] + [".."]
+    partitions = [f"{a}/{b}" for a, b in zip(starts, ends)]
+
+    covered = sum(api.count_items(collection["id"], datetime=p) or 0 for p in partitions)
+    if covered != count:
+        logger.warning(
+            f"{collection['id']}: partitions cover {covered} of {count} items, exporting it as a single unit"
+        )
+        return [None]
+    return partitions
+
+
+def run_coordinator(input_url, queue_path, partition_size):
+    api, collections = resolve_collections(input_url)
+
+    queue = WorkQueue(queue_path)
+    if queue.status():
+        logger.error(f"Queue {queue_path} already contains work units, use a new queue file")
+        sys.exit(1)
+
+    queue.set_meta("base_url", api.base_url)
+    for col in collections:
+        partitions = partition_collection(api, col, partition_size)
+        for part in partitions:
+            queue.add("items", col["id"], {"datetime": part})
+        queue.add("collection", col["id"])
+        logger.info(f"{col['id']}: queued {len(partitions)} item partition(s)")
+
+    logger.info(f"Queue {queue_path} ready: {queue.status()}")
+    queue.close()
+
+
+def run_unit(api, queue, unit, worker, validator=None):
+    collection_id = unit["collection_id"]
+
+    if unit["kind"] == "items":
+        part = unit["params"].get("datetime")
+        items = api.get_items(collection_id, datetime=part)
+        logger.info(f"{collection_id} [{part or 'all'}]: {len(items)} items")
+        queue.renew(unit["id"], worker)
+        export_item_records(collection_id, items, api.base_url, validator)
+        return [i["id"] for i in items]
+
+    item_ids = sorted({i for ids in queue.results(collection_id) for i in ids})
+    if not item_ids:
+        logger.info(f"Collection {collection_id} has no items, skipping item export")
+        return None
+    collection = api.get_collection(collection_id)
+    export_collection_record(collection, [{"id": i} for i in item_ids], api.base_url, validator)
+    return None
+
+
+def run_worker(queue_path, lease_seconds, validator=None):
+    queue = WorkQueue(queue_path, lease_seconds=lease_seconds)
+    base_url = queue.get_meta("base_url")
+    if not base_url:
+        logger.error(f"Queue {queue_path} has not been initialised by a coordinator")
+        sys.exit(1)
+
+    api = StacApiUtils(base_url)
+    worker = default_worker_id()
+    logger.info(f"Worker {worker} started on {queue_path}")
+
+    while True:
+        unit = queue.claim(worker)
+        if unit is None:
+            if not queue.has_open_work():
+                break
+            time.sleep(WORKER_POLL_SECONDS)
+            continue
+
+        try:
+            result = run_unit(api, queue, unit, worker, validator)
+        except Exception as e:
+            logger.error(f"Work unit {unit['id']} ({unit['kind']} {unit['collection_id']}) failed: {e}")
+            queue.fail(unit["id"], worker, e)
+            continue
+        queue.complete(unit["id"], worker, result)
+
+    logger.info(f"Worker {worker} finished: {queue.status()}")
+    for failure in queue.failures():
+        logger.error(
+            f"Failed {failure['kind']} unit for {failure['collection_id']} "
+            f"{failure['params'] or ''}: {failure['error']}"
+        )
+    queue.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a STAC API to DataCite JSON and OAI-AIRE XML")
+    parser.add_argument("url", nargs="?", help="STAC API or collection URL")
+    parser.add_argument("--coordinator", metavar="QUEUE_DB", help="Only enqueue work units into QUEUE_DB")
+    parser.add_argument("--worker", metavar="QUEUE_DB", help="Process work units from QUEUE_DB")
+    parser.add_argument("--partition-size", type=int, default=PARTITION_SIZE,
+                        help="Split collections with more items than this into datetime partitions")
+    parser.add_argument("--lease", type=int, default=LEASE_SECONDS, help="Work unit lease in seconds")
+    parser.add_argument("--validate", action="store_true", help="Validate OAI-AIRE records against the XSDs in schemas/")
+    parser.add_argument("--validation-report", default=None, help="Path of the validation report (JSON)")
+    args = parser.parse_args()
+
+    report_path = args.validation_report or os.path.join(
+        EXPORT_JSON_DIR, f"oai_aire_validation_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}.json"
+    )
+
+    if args.worker:
+        validator = create_validator(args.validate)
+        run_worker(args.worker, args.lease, validator)
+        finish_validation(validator, report_path)
+        return
+
+    if not args.url:
+        logger.error("Usage: python stac_to_datacite.py <STAC URL>")
+        sys.exit(1)
+
+    if args.coordinator:
+        run_coordinator(args.url, args.coordinator, args.partition_size)
+        return
+
+    validator = create_validator(args.validate)
+    api, collections = resolve_collections(args.url)
 
     all_items = {}
     if len(collections) > 1:
@@ -272,16 +467,10 @@ def main():
             logger.info(f"Collection {col['id']} has no items, skipping item export")
             continue
 
-        item_dc = [stac_item_to_datacite(i, api.base_url) for i in items]
-        col_dc = stac_collection_to_datacite(col, api.base_url, items)
-
-        if item_dc:
-            export_json(item_dc, "items", col["id"], is_item=True)
-            DataciteExportXML.export_oai_aire(item_dc, EXPORT_XML_DIR)
-
-        export_json([col_dc], "collections")
-        DataciteExportXML.export_oai_aire([col_dc], EXPORT_XML_DIR)
+        export_item_records(col["id"], items, api.base_url, validator)
+        export_collection_record(col, items, api.base_url, validator)
 
+    finish_validation(validator, report_path)
     logger.info("Datacite export complete")
 
 
@@ -13,7 +13,7 @@ def prettify_xml(element: ET.Element) -> str:
 
 class DataciteExportXML:
     @staticmethod
-    def export_oai_aire(records, output_dir, filename=None):
+    def export_oai_aire(records, output_dir, filename=None, validator=None):
         os.makedirs(output_dir, exist_ok=True)
         exported_files = []
 
@@ -23,6 +23,7 @@ class DataciteExportXML:
             header_el = ET.SubElement(record_el, "header")
 
             collection_name = ""
+            title = "unknown"
 
             for r in record.get("relatedIdentifiers", []):
                 if r.get("relationType") == "IsPartOf":
@@ -213,6 +214,9 @@ class DataciteExportXML:
             with open(filepath, "w", encoding="utf-8") as f:
                 f.write(pretty_xml)
 
+            if validator:
+                validator.submit(filepath, pretty_xml)
+
             exported_files.append(filepath)
             #print(f"Exported {filepath}")
 
@@ -0,0 +1,101 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "schemas")
+SCHEMA_ENTRY = "openaire.xsd"
+# openaire.xsd and the DataCite kernel-4, Dublin Core and xml: schemas it imports
+SCHEMA_FILES = (SCHEMA_ENTRY, "metadata.xsd", "dc.xsd", "xml.xsd")
+OAIRE_RESOURCE = "{http://namespace.openaire.eu/schema/oaire/}resource"
+
+_schema = None
+
+
+def missing_schemas(schema_dir=SCHEMA_DIR):
+    return [name for name in SCHEMA_FILES if not os.path.isfile(os.path.join(schema_dir, name))]
+
+
+def load_schema(schema_dir=SCHEMA_DIR):
+    global _schema
+    if _schema is not None:
+        return _schema
+
+    from lxml import etree
+
+    class LocalResolver(etree.Resolver):
+        def resolve(self, url, pubid, context):
+            path = os.path.join(schema_dir, url.rstrip("/").split("/")[-1])
+            if os.path.isfile(path):
+                return self.resolve_filename(path, context)
+            return None
+
+    entry = os.path.join(schema_dir, SCHEMA_ENTRY)
+    if not os.path.isfile(entry):
+        raise FileNotFoundError(f"OAI-AIRE schema not found: {entry}")
+
+    parser = etree.XMLParser(no_network=True, resolve_entities=False)
+    parser.resolvers.add(LocalResolver())
+    _schema = etree.XMLSchema(etree.parse(entry, parser))
+    return _schema
+
+
+def validate_record(xml_string):
+    from lxml import etree
+
+    try:
+        root = etree.fromstring(xml_string.encode("utf-8"))
+    except etree.XMLSyntaxError as e:
+        return [f"not well-formed: {e}"]
+
+    resource = root if root.tag == OAIRE_RESOURCE else root.find(f".//{OAIRE_RESOURCE}")
+    if resource is None:
+        return ["missing oaire:resource element"]
+
+    schema = load_schema()
+    if schema.validate(resource):
+        return []
+    return [f"line {e.line}: {e.message}" for e in schema.error_log]
+
+
+def validate_batch(records):
+    invalid = []
+    for name, xml_string in records:
+        errors = validate_record(xml_string)
+        if errors:
+            invalid.append({"file": name, "errors": errors})
+    return len(records), invalid
+
+
+class OaiAireValidator:
+    def __init__(self, schema_dir=SCHEMA_DIR, workers=None, batch_size=200):
+        load_schema(schema_dir)
+        self.batch_size = batch_size
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=load_schema, initargs=(schema_dir,))
+        self.pending = []
+        self.futures = []
+
+    def submit(self, name, xml_string):
+        self.pending.append((name, xml_string))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.futures.append(self.executor.submit(validate_batch, self.pending))
+            self.pending = []
+
+    def close(self):
+        self.flush()
+        total, invalid = 0, []
+        for future in self.futures:
+            count, errors = future.result()
+            total += count
+            invalid.extend(errors)
+        self.executor.shutdown()
+        return {"total": total, "invalid_count": len(invalid), "invalid": invalid}
+
+    @staticmethod
+    def write_report(report, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
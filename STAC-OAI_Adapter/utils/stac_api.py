@@ -17,12 +17,23 @@ class StacApiUtils:
         r.raise_for_status()
         return r.json()
 
-    def get_items(self, collection_id, limit=None):
+    def count_items(self, collection_id, datetime=None):
+        params = {"limit": 1}
+        if datetime:
+            params["datetime"] = datetime
+        r = requests.get(f"{self.base_url}/collections/{collection_id}/items", params=params)
+        r.raise_for_status()
+        data = r.json()
+        return data.get("numberMatched", (data.get("context") or {}).get("matched"))
+
+    def get_items(self, collection_id, limit=None, datetime=None):
         items = []
         url = f"{self.base_url}/collections/{collection_id}/items"
+        params = {"datetime": datetime} if datetime else None
 
         while url:
-            r = requests.get(url)
+            r = requests.get(url, params=params)
+            params = None
             r.raise_for_status()
             data = r.json()
 
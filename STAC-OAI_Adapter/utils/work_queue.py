@@ -0,0 +1,156 @@
+import json
+import os
+import socket
+import sqlite3
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    collection_id TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS units_status ON units (status, lease_until);
+"""
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    def __init__(self, path, lease_seconds=600, max_attempts=3):
+        self.db = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+    def close(self):
+        self.db.close()
+
+    def set_meta(self, key, value):
+        self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def get_meta(self, key):
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def add(self, kind, collection_id, params=None):
+        self.db.execute(
+            "INSERT INTO units (kind, collection_id, params) VALUES (?, ?, ?)",
+            (kind, collection_id, json.dumps(params or {}))
+        )
+
+    def claim(self, worker):
+        now = time.time()
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            self.db.execute(
+                "UPDATE units SET status = 'failed', error = COALESCE(error, 'lease expired') "
+                "WHERE status = 'leased' AND lease_until < ? AND attempts >= ?",
+                (now, self.max_attempts)
+            )
+            # a collection whose item units are finished but not all done cannot be exported completely
+            self.db.execute(
+                """
+                UPDATE units SET status = 'failed', lease_until = NULL,
+                    error = 'item partitions failed: ' || (
+                        SELECT COUNT(*) FROM units p
+                        WHERE p.collection_id = units.collection_id AND p.kind = 'items' AND p.status = 'failed')
+                WHERE kind = 'collection' AND status IN ('pending', 'leased')
+                  AND EXISTS (
+                      SELECT 1 FROM units p
+                      WHERE p.collection_id = units.collection_id AND p.kind = 'items' AND p.status = 'failed')
+                  AND NOT EXISTS (
+                      SELECT 1 FROM units p
+                      WHERE p.collection_id = units.collection_id AND p.kind = 'items'
+                        AND p.status IN ('pending', 'leased'))
+                """
+            )
+            # collection units wait until every item unit of the same collection is finished
+            row = self.db.execute(
+                """
+                SELECT id, kind, collection_id, params FROM units u
+                WHERE (status = 'pending' OR (status = 'leased' AND lease_until < ?))
+                  AND (kind != 'collection' OR NOT EXISTS (
+                      SELECT 1 FROM units p
+                      WHERE p.collection_id = u.collection_id AND p.kind = 'items'
+                        AND p.status != 'done'))
+                ORDER BY kind = 'collection', id
+                LIMIT 1
+                """,
+                (now,)
+            ).fetchone()
+            if row:
+                self.db.execute(
+                    "UPDATE units SET status = 'leased', worker = ?, lease_until = ?, attempts = attempts + 1 "
+                    "WHERE id = ?",
+                    (worker, now + self.lease_seconds, row[0])
+                )
+            self.db.execute("COMMIT")
+        except Exception:
+            self.db.execute("ROLLBACK")
+            raise
+
+        if not row:
+            return None
+        unit_id, kind, collection_id, params = row
+        return {"id": unit_id, "kind": kind, "collection_id": collection_id, "params": json.loads(params)}
+
+    def renew(self, unit_id, worker):
+        cur = self.db.execute(
+            "UPDATE units SET lease_until = ? WHERE id = ? AND worker = ? AND status = 'leased'",
+            (time.time() + self.lease_seconds, unit_id, worker)
+        )
+        return cur.rowcount == 1
+
+    def complete(self, unit_id, worker, result=None):
+        self.db.execute(
+            "UPDATE units SET status = 'done', lease_until = NULL, result = ?, error = NULL "
+            "WHERE id = ? AND worker = ?",
+            (json.dumps(result), unit_id, worker)
+        )
+
+    def fail(self, unit_id, worker, error):
+        self.db.execute(
+            "UPDATE units SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "lease_until = NULL, error = ? WHERE id = ? AND worker = ?",
+            (self.max_attempts, str(error), unit_id, worker)
+        )
+
+    def results(self, collection_id, kind="items"):
+        rows = self.db.execute(
+            "SELECT result FROM units WHERE collection_id = ? AND kind = ? AND status = 'done'",
+            (collection_id, kind)
+        ).fetchall()
+        return [json.loads(r[0]) for r in rows if r[0]]
+
+    def has_open_work(self):
+        row = self.db.execute(
+            "SELECT COUNT(*) FROM units WHERE status IN ('pending', 'leased')"
+        ).fetchone()
+        return row[0] > 0
+
+    def failures(self):
+        rows = self.db.execute(
+            "SELECT kind, collection_id, params, error FROM units WHERE status = 'failed' ORDER BY id"
+        ).fetchall()
+        return [
+            {"kind": kind, "collection_id": collection_id, "params": json.loads(params), "error": error}
+            for kind, collection_id, params, error in rows
+        ]
+
+    def status(self):
+        return dict(self.db.execute("SELECT status, COUNT(*) FROM units GROUP BY status").fetchall())
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+IMPORT_BUDGET_MS = 150
+HEAVY_MODULES = ("requests", "pydantic", "aiohttp")
+
+CHECK = f"""
+import sys, time
+start = time.perf_counter()
+import stac_cli.cli
+elapsed = (time.perf_counter() - start) * 1000
+loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+print(f"{{elapsed:.1f}} {{','.join(loaded)}}")
+"""
+
+
+def main():
+    runs = [subprocess.run([sys.executable, "-c", CHECK], capture_output=True, text=True, check=True).stdout.split()
+            for _ in range(5)]
+    best = min(float(r[0]) for r in runs)
+    loaded = runs[0][1] if len(runs[0]) > 1 else ""
+
+    print(f"stac_cli.cli import time: {best:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    failed = False
+    if loaded:
+        print(f"FAIL: heavy modules imported at startup: {loaded}")
+        failed = True
+    if best > IMPORT_BUDGET_MS:
+        print("FAIL: import time over budget")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import logging
+
+import aiohttp
+
+
+class AsyncSTAC:
+    def __init__(self, base_url: str, token: str | None = None, max_concurrency: int = 16):
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.session = None
+
+        self.logger = logging.getLogger("stac-client")
+
+        self.headers = {"Content-Type": "application/json"}
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+
+    async def __aenter__(self):
+        self._get_session()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self.session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+        return self.session
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def _request(self, Method: str, endpoint: str, **kwargs):
+        url = f"{self.base_url}{endpoint}"
+        self.logger.info(f"{Method} {url}")
+
+        async with self.semaphore:
+            async with self._get_session().request(Method, url, **kwargs) as response:
+                text = await response.text()
+
+        try:
+            data = json.loads(text)
+        except ValueError:
+            data = {"detail": [{"msg": text}]}
+
+        return data
+
+    async def getcollections(self):
+        data = await self._request("GET", "/collections")
+        collections = data.get("collections", [])
+        return [c.get("id") for c in collections if "id" in c]
+
+    async def getcollection(self, collection_id: str):
+        return await self._request("GET", f"/collections/{collection_id}")
+
+    async def get_items(self, collection_id: str, limit=1000):
+        data = await self._request("GET", f"/collections/{collection_id}/items?limit={limit}")
+        items = data.get("features", [])
+        return [item.get("id") for item in items if "id" in item]
+
+    async def add_item(self, collection_id, item: dict):
+        return await self._request("POST", f"/collections/{collection_id}/items", json=item)
+
+    async def get_item(self, collection_id, item_id):
+        return await self._request("GET", f"/collections/{collection_id}/items/{item_id}")
+
+    async def verify_token(self, token: str) -> bool:
+        try:
+            data = await self._request("GET", "/auth/realms/egi/protocol/openid-connect/userinfo",
+                                       headers={"Authorization": f"Bearer {token}",
+                                                "Content-type": "application/json"})
+            return bool(data.get("email_verified"))
+        except Exception:
+            return False
+
+    async def getcollections_many(self, collection_ids: list):
+        results = await asyncio.gather(*(self.getcollection(c) for c in collection_ids))
+        return dict(zip(collection_ids, results))
+
+    async def get_items_many(self, collection_id: str, item_ids: list):
+        results = await asyncio.gather(*(self.get_item(collection_id, i) for i in item_ids))
+        return dict(zip(item_ids, results))
@@ -0,0 +1,194 @@
+import copy
+import glob
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from .Template import prepare_item, validate_item
+
+logger = logging.getLogger("stac-client")
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl", ".geojsonl")
+
+
+class InvalidInput:
+    def __init__(self, source, line_no, raw, error):
+        self.source = source
+        self.line_no = line_no
+        self.raw = raw
+        self.error = error
+
+    @property
+    def label(self):
+        return f"{self.source}:{self.line_no}" if self.line_no else self.source
+
+
+def _read_json_file(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            raw = f.read()
+    except OSError as e:
+        yield InvalidInput(path, None, None, f"Could not read file: {e}")
+        return
+
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        yield InvalidInput(path, None, raw, f"Invalid JSON: {e}")
+        return
+
+    if isinstance(data, dict) and data.get("type") == "FeatureCollection":
+        yield from data.get("features", [])
+    else:
+        yield data
+
+
+def _read_ndjson(stream, source):
+    for line_no, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield InvalidInput(source, line_no, line, f"Invalid JSON on line {line_no}: {e}")
+
+
+def iter_items(source: str):
+    if source == "-":
+        yield from _read_ndjson(sys.stdin, "<stdin>")
+        return
+
+    if os.path.isdir(source):
+        paths = sorted(glob.glob(os.path.join(source, "*.json")))
+    elif glob.has_magic(source):
+        paths = sorted(glob.glob(source))
+    else:
+        paths = [source]
+
+    for path in paths:
+        if path.endswith(NDJSON_SUFFIXES):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    yield from _read_ndjson(f, path)
+            except OSError as e:
+                yield InvalidInput(path, None, None, f"Could not read file: {e}")
+        else:
+            yield from _read_json_file(path)
+
+
+def batched(iterable, size: int):
+    it = iter(iterable)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def response_errors(response) -> list:
+    if response is None:
+        return ["No response"]
+    if "detail" not in response:
+        return []
+    detail = response["detail"]
+    if isinstance(detail, list):
+        return [d.get("msg", str(d)) if isinstance(d, dict) else str(d) for d in detail]
+    return [str(detail)]
+
+
+class BulkReport:
+    def __init__(self):
+        self.succeeded = 0
+        self.failed = []
+
+    def add_failure(self, item, errors):
+        self.failed.append((item, errors))
+
+    @property
+    def total(self):
+        return self.succeeded + len(self.failed)
+
+    def write_retry_file(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            for item, _ in self.failed:
+                if isinstance(item, InvalidInput):
+                    if item.raw is not None:
+                        f.write(item.raw.strip() + "\n")
+                else:
+                    f.write(json.dumps(item) + "\n")
+
+    def summary(self) -> str:
+        lines = [f"{self.succeeded}/{self.total} items added, {len(self.failed)} failed"]
+        for item, errors in self.failed:
+            if isinstance(item, InvalidInput):
+                label = item.label
+            elif isinstance(item, dict):
+                label = item.get("id", "<no id>")
+            else:
+                label = "<not an object>"
+            lines.append(f"  {label}: {'; '.join(errors)}")
+        return "\n".join(lines)
+
+
+def bulk_add_items(client, collection_id: str, items, batch_size: int = 100,
+                   workers: int = 8, use_bulk: bool = True) -> BulkReport:
+    report = BulkReport()
+
+    def post_one(pair):
+        original, item = pair
+        try:
+            errors = response_errors(client.add_item(collection_id, item))
+        except Exception as e:
+            errors = [str(e)]
+        return original, errors
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for batch in batched(items, batch_size):
+            valid = []
+            for original in batch:
+                if isinstance(original, InvalidInput):
+                    report.add_failure(original, [original.error])
+                    continue
+                if not isinstance(original, dict):
+                    report.add_failure(original, ["item must be a JSON object"])
+                    continue
+                item = prepare_item(copy.deepcopy(original), keep_existing=True)
+                item.setdefault("collection", collection_id)
+                try:
+                    validate_item(item)
+                except ValueError as e:
+                    report.add_failure(original, [str(e)])
+                    continue
+                valid.append((original, item))
+
+            if not valid:
+                continue
+
+            if use_bulk:
+                try:
+                    response = client.add_items_bulk(collection_id, [item for _, item in valid])
+                except Exception as e:
+                    response = {"detail": [{"msg": str(e)}]}
+
+                if response is None:
+                    logger.info("Bulk endpoint not available, falling back to per-item POST")
+                    use_bulk = False
+                else:
+                    errors = response_errors(response)
+                    for original, _ in valid:
+                        if errors:
+                            report.add_failure(original, errors)
+                        else:
+                            report.succeeded += 1
+                    continue
+
+            for original, errors in executor.map(post_one, valid):
+                if errors:
+                    report.add_failure(original, errors)
+                else:
+                    report.succeeded += 1
+
+            logger.info(f"{report.total} items processed")
+
+    return report
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import logging
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .TokenCache import CACHE_DIR
+
+DEFAULT_DB = CACHE_DIR / "mirror.sqlite"
+
+logger = logging.getLogger("stac-client")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS collections (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    synced_at TEXT
+);
+CREATE TABLE IF NOT EXISTS items (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    collection TEXT NOT NULL,
+    start_ts REAL,
+    end_ts REAL,
+    hash TEXT NOT NULL,
+    data TEXT NOT NULL,
+    UNIQUE (collection, id)
+);
+CREATE INDEX IF NOT EXISTS items_time ON items (start_ts, end_ts);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_rtree USING rtree (id, minx, maxx, miny, maxy);
+"""
+SCHEMA_VERSION = 1
+
+
+def parse_datetime(value: str | None) -> float | None:
+    if not value or value == "..":
+        return None
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def parse_interval(value: str | None):
+    if not value:
+        return None, None
+    if "/" in value:
+        start, end = value.split("/", 1)
+        return parse_datetime(start), parse_datetime(end)
+    instant = parse_datetime(value)
+    return instant, instant
+
+
+def parse_bbox(value: str | None):
+    if not value:
+        return None
+    bbox = [float(v) for v in value.split(",")]
+    if len(bbox) != 4:
+        raise ValueError("bbox must be west,south,east,north")
+    return bbox
+
+
+def bbox_boxes(bbox):
+    if not isinstance(bbox, list) or len(bbox) not in (4, 6):
+        return []
+    dims = len(bbox) // 2
+    west, south, east, north = bbox[0], bbox[1], bbox[dims], bbox[dims + 1]
+    if south > north:
+        return []
+    # bboxes crossing the antimeridian are split into an eastern and a western box
+    if west > east:
+        return [(west, 180.0, south, north), (-180.0, east, south, north)]
+    return [(west, east, south, north)]
+
+
+def item_interval(item: dict):
+    props = item.get("properties") or {}
+    start = props.get("start_datetime") or props.get("datetime")
+    end = props.get("end_datetime") or props.get("datetime")
+    try:
+        return parse_datetime(start), parse_datetime(end)
+    except ValueError:
+        return None, None
+
+
+class Mirror:
+    def __init__(self, path=DEFAULT_DB):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+        if self.db.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self._rebuild_rtree()
+
+    def _rebuild_rtree(self):
+        with self.db:
+            self.db.execute("DELETE FROM items_rtree")
+            for rowid, data in self.db.execute("SELECT rowid, data FROM items").fetchall():
+                self._index_bbox(rowid, json.loads(data).get("bbox"))
+            self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        self.db.close()
+
+    def sync_collection(self, client, collection_id: str):
+        collection = client.getcollection(collection_id)
+        if "detail" in collection:
+            raise ValueError(f"Could not fetch collection {collection_id}: {collection['detail']}")
+
+        known = dict(self.db.execute(
+            "SELECT id, hash FROM items WHERE collection = ?", (collection_id,)
+        ).fetchall())
+        seen = set()
+        added = updated = 0
+
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO collections (id, data, synced_at) VALUES (?, ?, ?)",
+                (collection_id, json.dumps(collection), datetime.now(timezone.utc).isoformat())
+            )
+
+            for item in client.iter_collection_items(collection_id):
+                item_id = item.get("id")
+                if not item_id:
+                    continue
+                seen.add(item_id)
+
+                data = json.dumps(item, sort_keys=True)
+                digest = hashlib.sha256(data.encode("utf-8")).hexdigest()
+                if known.get(item_id) == digest:
+                    continue
+
+                if item_id in known:
+                    self._delete_item(collection_id, item_id)
+                    updated += 1
+                else:
+                    added += 1
+                self._insert_item(collection_id, item_id, item, data, digest)
+
+            removed = [i for i in known if i not in seen]
+            for item_id in removed:
+                self._delete_item(collection_id, item_id)
+
+        logger.info(f"{collection_id}: {added} added, {updated} updated, {len(removed)} removed")
+        return added, updated, len(removed)
+
+    def _insert_item(self, collection_id, item_id, item, data, digest):
+        start, end = item_interval(item)
+        cur = self.db.execute(
+            "INSERT INTO items (id, collection, start_ts, end_ts, hash, data) VALUES (?, ?, ?, ?, ?, ?)",
+            (item_id, collection_id, start, end, digest, data)
+        )
+        self._index_bbox(cur.lastrowid, item.get("bbox"))
+
+    def _index_bbox(self, rowid, bbox):
+        # each item owns the R-tree ids rowid * 2 and rowid * 2 + 1
+        for offset, box in enumerate(bbox_boxes(bbox)):
+            self.db.execute(
+                "INSERT INTO items_rtree (id, minx, maxx, miny, maxy) VALUES (?, ?, ?, ?, ?)",
+                (rowid * 2 + offset, *box)
+            )
+
+    def _delete_item(self, collection_id, item_id):
+        row = self.db.execute(
+            "SELECT rowid FROM items WHERE collection = ? AND id = ?", (collection_id, item_id)
+        ).fetchone()
+        if row:
+            self.db.execute("DELETE FROM items_rtree WHERE id IN (?, ?)", (row[0] * 2, row[0] * 2 + 1))
+            self.db.execute("DELETE FROM items WHERE rowid = ?", row)
+
+    def search(self, bbox=None, datetime_range=None, collections=None, limit=None):
+        query = "SELECT i.data FROM items i"
+        where, params = [], []
+
+        if bbox:
+            west, south, east, north = bbox
+            spatial, spatial_params = ["r.miny <= ?", "r.maxy >= ?"], [north, south]
+            if west <= east:
+                spatial += ["r.minx <= ?", "r.maxx >= ?"]
+                spatial_params += [east, west]
+            else:
+                spatial.append("(r.maxx >= ? OR r.minx <= ?)")
+                spatial_params += [west, east]
+            where.append(f"i.rowid IN (SELECT r.id / 2 FROM items_rtree r WHERE {' AND '.join(spatial)})")
+            params += spatial_params
+
+        start, end = datetime_range or (None, None)
+        if start is not None:
+            where.append("i.end_ts >= ?")
+            params.append(start)
+        if end is not None:
+            where.append("i.start_ts <= ?")
+            params.append(end)
+
+        if collections:
+            where.append(f"i.collection IN ({', '.join('?' for _ in collections)})")
+            params += list(collections)
+
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        return [json.loads(row[0]) for row in self.db.execute(query, params)]
+
+    def collections(self):
+        return [row[0] for row in self.db.execute("SELECT id FROM collections ORDER BY id")]
@@ -1,33 +1,184 @@
 from pydantic import BaseModel, validator, Field
-from typing import List, Dict, Literal, Optional
+from typing import Any, List, Dict, Literal, Optional
+from urllib.parse import urlparse
+from datetime import datetime
+import re
+
+GEOMETRY_TYPES = ("Point", "MultiPoint", "LineString", "MultiLineString",
+                  "Polygon", "MultiPolygon", "GeometryCollection")
+NETLOC_SCHEMES = ("http", "https", "s3", "gs", "ftp")
+RFC3339 = re.compile(
+    r"^(\d{4}-\d{2}-\d{2})[Tt ](\d{2}:\d{2}:\d{2})(\.\d+)?([Zz]|[+-]\d{2}:\d{2})$"
+)
+
+
+def _check_rfc3339(value):
+    match = RFC3339.match(value)
+    if not match:
+        raise ValueError("must be an RFC 3339 datetime, e.g. 2020-01-01T00:00:00Z")
+    date, time, _, offset = match.groups()
+    offset = "+00:00" if offset in ("Z", "z") else offset
+    try:
+        datetime.fromisoformat(f"{date}T{time}{offset}")
+    except ValueError as e:
+        raise ValueError(f"invalid datetime: {e}")
+
+
+def _check_position(p):
+    if not isinstance(p, list) or len(p) not in (2, 3):
+        raise ValueError("position must be [x, y] or [x, y, z]")
+    if not all(isinstance(c, (int, float)) and not isinstance(c, bool) for c in p):
+        raise ValueError("position values must be numbers")
+
+
+def _check_positions(ps, minimum):
+    if not isinstance(ps, list) or len(ps) < minimum:
+        raise ValueError(f"expected a list of at least {minimum} positions")
+    for p in ps:
+        _check_position(p)
+
+
+def _check_polygon(rings):
+    if not isinstance(rings, list) or not rings:
+        raise ValueError("polygon must contain at least one linear ring")
+    for ring in rings:
+        _check_positions(ring, 4)
+        if ring[0] != ring[-1]:
+            raise ValueError("linear ring must be closed (first and last positions equal)")
+
+
+def _check_list(value, check):
+    if not isinstance(value, list):
+        raise ValueError("expected a list")
+    for v in value:
+        check(v)
+
+
+COORDINATE_CHECKS = {
+    "Point": _check_position,
+    "MultiPoint": lambda c: _check_positions(c, 0),
+    "LineString": lambda c: _check_positions(c, 2),
+    "MultiLineString": lambda c: _check_list(c, lambda ls: _check_positions(ls, 2)),
+    "Polygon": _check_polygon,
+    "MultiPolygon": lambda c: _check_list(c, _check_polygon),
+}
+
+
+def iter_positions(geometry):
+    if geometry.type == "GeometryCollection":
+        for g in geometry.geometries or []:
+            yield from iter_positions(g)
+        return
+
+    stack = [geometry.coordinates]
+    while stack:
+        value = stack.pop()
+        if value and isinstance(value[0], (int, float)):
+            yield value
+        else:
+            stack.extend(value)
 
 
 class Geometry(BaseModel):
-    type: str
-    coordinates: List[float]
+    type: Literal[GEOMETRY_TYPES]
+    coordinates: Any = None
+    geometries: Optional[List["Geometry"]] = None
+
+    @validator("coordinates", always=True)
+    def validate_coordinates(cls, v, values):
+        geom_type = values.get("type")
+        if geom_type is None:
+            return v
+        if geom_type == "GeometryCollection":
+            return v
+        COORDINATE_CHECKS[geom_type](v)
+        return v
+
+    @validator("geometries", always=True)
+    def validate_geometries(cls, v, values):
+        if values.get("type") == "GeometryCollection" and v is None:
+            raise ValueError("GeometryCollection requires geometries")
+        return v
+
+
+Geometry.update_forward_refs()
 
 
 class Asset(BaseModel):
-    href: Optional[str] = None
+    href: str
     type: Optional[str] = None
     roles: Optional[List[str]] = None
 
+    @validator("href")
+    def validate_href(cls, v):
+        if not v.strip():
+            raise ValueError("href must not be empty")
+        if any(c.isspace() for c in v):
+            raise ValueError("href must be a URL or relative path without whitespace")
+
+        url = urlparse(v)
+        if url.scheme in NETLOC_SCHEMES and not url.netloc:
+            raise ValueError(f"{url.scheme} href must include a host")
+        if url.scheme == "file" and not url.path:
+            raise ValueError("file href must include a path")
+        return v
+
 
 class Properties(BaseModel):
-    datetime: str
+    datetime: Optional[str] = Field(...)
     title: Optional[str] = None
     description: Optional[str] = None
+    start_datetime: Optional[str] = None
+    end_datetime: Optional[str] = None
+
+    @validator("datetime", "start_datetime", "end_datetime")
+    def validate_rfc3339(cls, v):
+        if v is not None:
+            _check_rfc3339(v)
+        return v
+
+    @validator("end_datetime", always=True)
+    def validate_datetime_range(cls, v, values):
+        if "datetime" in values and values["datetime"] is None and not (values.get("start_datetime") and v):
+            raise ValueError("start_datetime and end_datetime are required when datetime is null")
+        return v
 
 
 class STACItem(BaseModel):
     id: str
     type: Literal["Feature"] = "Feature"
-    collection: str
-    geometry: Geometry
-    bbox: List[float]
+    collection: Optional[str] = None
+    geometry: Optional[Geometry]
+    bbox: Optional[List[float]] = None
     properties: Properties
     assets: Dict[str, Asset] = Field(default_factory=dict)
 
+    @validator("bbox", always=True)
+    def validate_bbox(cls, v, values):
+        geometry = values.get("geometry")
+        if v is None:
+            if geometry is not None:
+                raise ValueError("bbox is required when geometry is set")
+            return v
+        if len(v) not in (4, 6):
+            raise ValueError("bbox must have 4 or 6 values")
+
+        dims = len(v) // 2
+        west, south, east, north = v[0], v[1], v[dims], v[dims + 1]
+        if south > north:
+            raise ValueError("bbox south must be lower than north")
+        if geometry is None:
+            return v
+
+        eps = 1e-9
+        for p in iter_positions(geometry):
+            x, y = p[0], p[1]
+            if not south - eps <= y <= north + eps:
+                raise ValueError(f"geometry position {p} is outside bbox")
+            if west <= east and not west - eps <= x <= east + eps:
+                raise ValueError(f"geometry position {p} is outside bbox")
+        return v
+
     @validator("assets")
     def validate_assets(cls, v):
-        return v or {}
\ No newline at end of file
+        return v or {}
@@ -1,11 +1,17 @@
 import requests
+from requests.adapters import HTTPAdapter
 import logging
+from .TokenCache import token_expired, is_cached, cache_token
 
 class STAC :
-    def __init__(self, base_url:str, token:str | None = None):
+    def __init__(self, base_url:str, token:str | None = None, pool_size:int = 10):
         self.base_url = base_url.rstrip("/")
         self.session = requests.Session()
 
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         self.logger = logging.getLogger("stac-client")
 
         if token:
@@ -17,7 +23,7 @@ class STAC :
         })
 
     def _request(self, Method: str, endpoint: str, **kwargs):
-        url = f"{self.base_url}{endpoint}"
+        url = endpoint if endpoint.startswith(("http://", "https://")) else f"{self.base_url}{endpoint}"
         self.logger.info(f"{Method} {url}")
 
         response = self.session.request(Method, url, **kwargs)
@@ -45,23 +51,98 @@ class STAC :
         items = data.get("features",[])
         return [item.get("id") for item in items if "id" in item]
     
+    def iter_collection_items(self, collection_id: str, limit=1000):
+        endpoint = f"/collections/{collection_id}/items?limit={limit}"
+        while endpoint:
+            data = self._request("GET", endpoint)
+            if "detail" in data:
+                raise ValueError(f"Could not fetch items of {collection_id}: {data['detail']}")
+            yield from data.get("features", [])
+            endpoint = next((l.get("href") for l in data.get("links", []) if l.get("rel") == "next"), None)
+
+    def search(self, bbox=None, intersects=None, datetime=None, collections=None, ids=None,
+               fields=None, filter=None, filter_lang=None, limit=100, max_items=None):
+        if bbox and intersects:
+            raise ValueError("bbox and intersects cannot be used together")
+
+        body = {
+            "bbox": bbox,
+            "intersects": intersects,
+            "datetime": datetime,
+            "collections": collections,
+            "ids": ids,
+            "fields": fields,
+            "filter": filter,
+            "filter-lang": filter_lang if filter else None,
+            "limit": limit,
+        }
+        body = {k: v for k, v in body.items() if v}
+
+        method, endpoint, count = "POST", "/search", 0
+        while endpoint:
+            data = self._request(method, endpoint, json=body if method == "POST" else None)
+            if "detail" in data:
+                raise ValueError(f"Search failed: {data['detail']}")
+
+            for feature in data.get("features", []):
+                yield feature
+                count += 1
+                if max_items and count >= max_items:
+                    return
+
+            link = next((l for l in data.get("links", []) if l.get("rel") == "next"), None)
+            if not link:
+                break
+            endpoint = link.get("href")
+            method = link.get("method", "GET").upper()
+            if "body" in link:
+                body = {**body, **link["body"]} if link.get("merge") else link["body"]
+
     def add_item(self,collection_id,item: dict):
         return self._request( "POST", f"/collections/{collection_id}/items", json=item )
+
+    def add_items_bulk(self, collection_id, items: list):
+        url = f"{self.base_url}/collections/{collection_id}/bulk_items"
+        self.logger.info(f"POST {url}")
+
+        response = self.session.post(url, json={"items": {i["id"]: i for i in items}, "method": "insert"})
+        if response.status_code in (404, 405):
+            return None
+
+        try:
+            data = response.json()
+        except ValueError:
+            data = {"detail": [{"msg": response.text}]}
+        if not response.ok and "detail" not in data:
+            data = {"detail": [{"msg": response.text}]}
+
+        return data
     
     def get_item(self, collection_id, item_id):
         return self._request("GET",f"/collections/{collection_id}/items/{item_id}")
     
 
-    def verify_token(self,token:str) -> bool:
+    def verify_token(self,token:str, use_cache: bool = True) -> bool:
+        if token_expired(token):
+            self.logger.info("Token expired, skipping userinfo request")
+            return False
+        if use_cache and is_cached(token):
+            return True
+
         try:
             data = self._request("GET","/auth/realms/egi/protocol/openid-connect/userinfo",headers = {"Authorization": f"Bearer {token}",
     "Content-type": "application/json"})
-            print(data)
+            self.logger.debug(data)
             response = data.get("email_verified")
 
             if response:
+                if use_cache:
+                    try:
+                        cache_token(token)
+                    except OSError as e:
+                        self.logger.warning(f"Could not write token cache: {e}")
                 return True
             else :
                 return False
         except Exception:
-            return False
\ No newline at end of file
+            return False
@@ -1,5 +1,4 @@
-from .Model import STACItem, Geometry, Asset, Properties
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 from pathlib import Path
 import json
@@ -43,6 +42,17 @@ def create_item_template(output_dir: str="item_template.json"):
         json.dump(template,f,indent=2)
     print(f"Template Created at {output_file.resolve()}")
 
+def prepare_item(item: dict, keep_existing: bool = False):
+    props = item.get("properties") or {}
+    item["properties"] = props
+
+    if not (keep_existing and item.get("id")):
+        item["id"] = str(uuid.uuid4())
+    if not (keep_existing and (props.get("datetime") or (props.get("start_datetime") and props.get("end_datetime")))):
+        props["datetime"] = datetime.now(timezone.utc).isoformat()
+    item.setdefault("links", [])
+    return item
+
 def validate_item (item : dict):
     required_fields = ["type", "geometry", "bbox", "properties", "assets"]
 
@@ -52,5 +62,9 @@ def validate_item (item : dict):
     
     if item["type"] != "Feature":
         raise ValueError("Stac item type must be Feature")
-    
-    
\ No newline at end of file
+
+    from .Validator import item_errors
+
+    errors = item_errors(item)
+    if errors:
+        raise ValueError("; ".join(errors))
@@ -0,0 +1,71 @@
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+CACHE_DIR = Path(os.getenv("STAC_CLI_CACHE_DIR", Path.home() / ".cache" / "stac_cli"))
+CACHE_FILE = CACHE_DIR / "tokens.json"
+
+
+def token_claims(token: str) -> dict | None:
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except ValueError:
+        return None
+    return claims if isinstance(claims, dict) else None
+
+
+def token_expiry(token: str) -> float | None:
+    claims = token_claims(token) or {}
+    exp = claims.get("exp")
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+def token_expired(token: str) -> bool:
+    exp = token_expiry(token)
+    return exp is not None and exp <= time.time()
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _load() -> dict:
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def is_cached(token: str) -> bool:
+    exp = _load().get(_token_key(token))
+    return isinstance(exp, (int, float)) and exp > time.time()
+
+
+def cache_token(token: str):
+    exp = token_expiry(token)
+    if exp is None or exp <= time.time():
+        return
+
+    now = time.time()
+    data = {k: v for k, v in _load().items() if isinstance(v, (int, float)) and v > now}
+    data[_token_key(token)] = exp
+
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=CACHE_FILE.parent, prefix="tokens.", suffix=".tmp",
+                                     encoding="utf-8", delete=False) as f:
+        json.dump(data, f)
+    try:
+        os.replace(f.name, CACHE_FILE)
+    except OSError:
+        os.unlink(f.name)
+        raise
@@ -0,0 +1,79 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+
+from pydantic import ValidationError
+
+from .Bulk import InvalidInput
+from .Model import STACItem
+
+MIN_PARALLEL_CHUNKS = 4
+
+
+def item_errors(item) -> list:
+    if isinstance(item, InvalidInput):
+        return [item.error]
+    if not isinstance(item, dict):
+        return ["item must be a JSON object"]
+    try:
+        STACItem(**item)
+    except ValidationError as e:
+        return [f"{'.'.join(str(l) for l in err['loc']) or 'item'}: {err['msg']}" for err in e.errors()]
+    return []
+
+
+def _validate_chunk(chunk):
+    start, items = chunk
+    results = []
+    for offset, item in enumerate(items):
+        errors = item_errors(item)
+        if errors:
+            if isinstance(item, InvalidInput):
+                item_id = item.label
+            else:
+                item_id = item.get("id") if isinstance(item, dict) else None
+            results.append({"index": start + offset, "id": item_id, "errors": errors})
+    return len(items), results
+
+
+def _chunks(items, chunk_size):
+    chunk, start = [], 0
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield start, chunk
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def validate_items(items, workers: int | None = None, chunk_size: int = 500):
+    workers = workers or os.cpu_count() or 1
+    total, invalid = 0, []
+
+    def collect(result):
+        nonlocal total
+        count, errors = result
+        total += count
+        invalid.extend(errors)
+
+    chunks = _chunks(items, chunk_size)
+    head = list(islice(chunks, MIN_PARALLEL_CHUNKS)) if workers > 1 else []
+
+    if workers == 1 or len(head) < MIN_PARALLEL_CHUNKS:
+        for chunk in chain(head, chunks):
+            collect(_validate_chunk(chunk))
+        return total, invalid
+
+    in_flight = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in chain(head, chunks):
+            if len(in_flight) >= workers * 2:
+                collect(in_flight.popleft().result())
+            in_flight.append(executor.submit(_validate_chunk, chunk))
+        while in_flight:
+            collect(in_flight.popleft().result())
+
+    return total, invalid
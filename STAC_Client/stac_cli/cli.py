@@ -1,10 +1,7 @@
 import click
 import json
 import os
-import uuid
-from datetime import datetime, timezone
-from .Stac import STAC
-from .Template import create_item_template,validate_item
+from .TokenCache import token_expired
 
 BASE_URL = "https://api.eneslab.pilot.eosc-beyond.eu/"
 
@@ -23,6 +20,8 @@ def collections():
 @collections.command("get")
 @click.option("--collection_id", required=False)
 def get_collections(collection_id):
+    from .Stac import STAC
+
     client = STAC(BASE_URL)
 
     if collection_id:
@@ -44,6 +43,8 @@ def items():
 @click.option("--collection_id", required=True)
 @click.option("--item_id", required=False)
 def get_items(collection_id, item_id):
+    from .Stac import STAC
+
     client = STAC(BASE_URL)
 
     if item_id:
@@ -53,13 +54,89 @@ def get_items(collection_id, item_id):
     print(json.dumps(data, indent=2))
 
 
+def _read_option(value):
+    if value is not None and os.path.isfile(value):
+        with open(value, "r", encoding="utf-8") as f:
+            return f.read()
+    return value
+
+
+def _json_option(value):
+    value = _read_option(value)
+    return json.loads(value) if value is not None else None
+
+
+def _filter_option(value):
+    value = _read_option(value)
+    if not value:
+        return None, None
+    try:
+        return json.loads(value), "cql2-json"
+    except ValueError:
+        return value.strip(), "cql2-text"
+
+
+def _fields_option(value):
+    if not value:
+        return None
+    fields = [f.strip() for f in value.split(",") if f.strip()]
+    return {
+        "include": [f.lstrip("+") for f in fields if not f.startswith("-")],
+        "exclude": [f[1:] for f in fields if f.startswith("-")],
+    }
+
+
+@items.command("search")
+@click.option("--bbox", default=None, help="west,south,east,north")
+@click.option("--intersects", default=None, help="GeoJSON geometry, inline or as a file path")
+@click.option("--datetime", "datetime_", default=None, help="Instant or interval, e.g. 2020-01-01T00:00:00Z/..")
+@click.option("--collections", multiple=True)
+@click.option("--ids", multiple=True)
+@click.option("--fields", default=None, help="Comma separated fields, prefix with '-' to exclude")
+@click.option("--filter", "filter_", default=None, help="CQL2 filter: JSON (inline or file path) or CQL2 text")
+@click.option("--limit", default=100, show_default=True, help="Page size")
+@click.option("--max-items", default=None, type=int)
+@click.option("--full", is_flag=True, help="Print full items as NDJSON instead of ids")
+def search_items(bbox, intersects, datetime_, collections, ids, fields, filter_, limit, max_items, full):
+    from .Stac import STAC
+
+    if bbox and intersects:
+        print("Invalid search parameters: --bbox and --intersects cannot be used together")
+        return
+
+    try:
+        bbox = [float(v) for v in bbox.split(",")] if bbox else None
+        intersects = _json_option(intersects)
+        filter_, filter_lang = _filter_option(filter_)
+    except (OSError, ValueError) as e:
+        print(f"Invalid search parameters: {e}")
+        return
+
+    client = STAC(BASE_URL)
+    results = client.search(bbox=bbox, intersects=intersects, datetime=datetime_,
+                            collections=list(collections), ids=list(ids),
+                            fields=_fields_option(fields), filter=filter_, filter_lang=filter_lang,
+                            limit=limit, max_items=max_items)
+    try:
+        for item in results:
+            print(json.dumps(item) if full else item.get("id"))
+    except ValueError as e:
+        print(e)
+
+
 @items.command("add")
 @click.option("--collection_id", required=True)
 @click.option("--token", required=True)
 @click.option("--file", "file_path", required=True)
 def add_item(collection_id, token, file_path):
+    from .Stac import STAC
+    from .Template import validate_item, prepare_item
     
-    token = resolve_token(token)
+    try:
+        token = resolve_token(token)
+    except ValueError as e:
+        print(e)
+        return
     client = STAC(BASE_URL, token)
     
     with open(file_path, "r", encoding="utf-8") as f:
@@ -67,10 +144,8 @@ def add_item(collection_id, token, file_path):
 
    
 
-    item["id"] = str(uuid.uuid4())
-    item.setdefault("properties", {})
-    item["properties"]["datetime"] = datetime.now(timezone.utc).isoformat()
-    item.setdefault("links", [])
+    prepare_item(item)
+    item.setdefault("collection", collection_id)
 
     try:
         validate_item(item)
@@ -82,14 +157,128 @@ def add_item(collection_id, token, file_path):
         #print(json.dumps(response, indent=2))
         print(f"Item added to {collection_id}")
     except ValueError as e:
-        print(f"Item not added:")
+        print(f"Item not added: {e}")
+
+@items.command("bulk-add")
+@click.option("--collection_id", required=True)
+@click.option("--token", required=False)
+@click.option("--source", required=True, help="Directory, glob, NDJSON file or '-' for NDJSON on stdin")
+@click.option("--batch-size", default=100, show_default=True)
+@click.option("--workers", default=8, show_default=True)
+@click.option("--bulk/--no-bulk", default=True, show_default=True, help="Use the Transactions bulk_items endpoint when available")
+@click.option("--retry-file", default="failed_items.ndjson", show_default=True)
+def bulk_add_items_cmd(collection_id, token, source, batch_size, workers, bulk, retry_file):
+    from .Stac import STAC
+    from .Bulk import iter_items, bulk_add_items
+    
+    try:
+        token = resolve_token(token)
+    except ValueError as e:
+        print(e)
+        return
+
+    client = STAC(BASE_URL, token, pool_size=workers)
+
+    report = bulk_add_items(client, collection_id, iter_items(source),
+                            batch_size=batch_size, workers=workers, use_bulk=bulk)
+
+    print(report.summary())
+    report.write_retry_file(retry_file)
+    if report.failed:
+        print(f"Failed items written to {retry_file}")
+
+
+@items.command("validate")
+@click.option("--source", required=True, help="Directory, glob, NDJSON file or '-' for NDJSON on stdin")
+@click.option("--workers", default=None, type=int, help="Worker processes (default: CPU count)")
+@click.option("--chunk-size", default=500, show_default=True)
+@click.option("--report", "report_path", default=None, help="Write the per-item error report as JSON")
+def validate_items_cmd(source, workers, chunk_size, report_path):
+    from .Bulk import iter_items
+    from .Template import prepare_item
+    from .Validator import validate_items
+
+    def as_submitted(item):
+        if not isinstance(item, dict):
+            return item
+        return prepare_item(item, keep_existing=True)
+
+    items = (as_submitted(item) for item in iter_items(source))
+    total, invalid = validate_items(items, workers=workers, chunk_size=chunk_size)
+
+    for result in invalid:
+        print(f"item {result['index']} ({result['id']}): {'; '.join(result['errors'])}")
+    print(f"{total - len(invalid)}/{total} items valid")
+
+    if report_path:
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump({"total": total, "invalid": invalid}, f, indent=2)
+        print(f"Report written to {report_path}")
+
 
 @items.command("create_template")
 @click.option("--output", default="item_template.json")
 def create_template_cmd(output):
+    from .Template import create_item_template
+
     create_item_template(output)
 
 
+@stac_cli.command("mirror")
+@click.option("--collection_id", "collection_ids", multiple=True, help="Collection to mirror (default: all)")
+@click.option("--db", "db_path", default=None, help="Mirror database path")
+def mirror_cmd(collection_ids, db_path):
+    from .Stac import STAC
+    import sqlite3
+    from .Mirror import Mirror, DEFAULT_DB
+
+    client = STAC(BASE_URL)
+    mirror = Mirror(db_path or DEFAULT_DB)
+
+    try:
+        for collection_id in collection_ids or client.getcollections():
+            try:
+                added, updated, removed = mirror.sync_collection(client, collection_id)
+            except (ValueError, sqlite3.Error) as e:
+                print(f"{collection_id}: sync failed: {e}")
+                continue
+            print(f"{collection_id}: {added} added, {updated} updated, {removed} removed")
+    finally:
+        mirror.close()
+
+
+@stac_cli.group()
+def local():
+    pass
+
+
+@local.command("search")
+@click.option("--bbox", default=None, help="west,south,east,north")
+@click.option("--datetime", "datetime_", default=None, help="Instant or interval, e.g. 2020-01-01/2020-12-31 or 2020-01-01/..")
+@click.option("--collection", "collections", multiple=True)
+@click.option("--limit", default=None, type=int)
+@click.option("--full", is_flag=True, help="Print full items instead of ids")
+@click.option("--db", "db_path", default=None, help="Mirror database path")
+def local_search(bbox, datetime_, collections, limit, full, db_path):
+    from .Mirror import Mirror, DEFAULT_DB, parse_bbox, parse_interval
+
+    try:
+        bbox = parse_bbox(bbox)
+        interval = parse_interval(datetime_)
+    except ValueError as e:
+        print(e)
+        return
+
+    mirror = Mirror(db_path or DEFAULT_DB)
+    try:
+        results = mirror.search(bbox, interval, collections, limit)
+    finally:
+        mirror.close()
+
+    data = results if full else [item.get("id") for item in results]
+    print(json.dumps(data, indent=2))
+
+
 @stac_cli.group()
 def auth():
     pass
@@ -98,16 +287,21 @@ def resolve_token(cli_token):
     token = cli_token or os.getenv("TOKEN")
     if not token:
         raise ValueError("Token not provided. Use --token or export TOKEN.")
+    if token_expired(token):
+        raise ValueError("Token expired. Please obtain a new token.")
     return token
 
 @auth.command("verify")
 @click.option("--token", required=False)
-def verify_token(token):
+@click.option("--no-cache", is_flag=True, help="Always query the identity provider")
+def verify_token(token, no_cache):
+    from .Stac import STAC
+
     try:
         token = resolve_token(token)
         client = STAC("https://aai-demo.egi.eu")
 
-        result = client.verify_token(token)
+        result = client.verify_token(token, use_cache=not no_cache)
 
         if result:
             print("Token Valid")